@@ -7,66 +7,172 @@
 # and processing
 
 import argparse
-
-import eventregistry as ER
-import json
+import copy
+import queue
+import re
+import signal
 import sys
 import os
+import threading
+
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from functools import lru_cache
+from itertools import islice
+from typing import TYPE_CHECKING, NamedTuple
+
+try:
+    # orjson is considerably faster at (de)serializing the collected
+    # articles and writes the output directly as bytes
+    import orjson
+
+    json_dumps = orjson.dumps
+    json_loads = orjson.loads
+except ImportError:
+    import json
 
-from dotenv import load_dotenv
+    def json_dumps(obj):
+        return json.dumps(obj).encode("utf-8")
 
-load_dotenv()
+    json_loads = json.loads
 
+if TYPE_CHECKING:
+    import eventregistry as ER
 
-API_KEY = os.getenv("API_KEY")
+__version__ = "1.0.0"
 
 #######################################
 # Helper Functions
 #######################################
 
 
+def get_api_key():
+    """Gets the event registry API key
+
+    The key is read from the `API_KEY` environment variable, which
+    can also be set in the `.env` file.
+
+    Returns:
+        str: The event registry API key.
+
+    """
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    return os.getenv("API_KEY")
+
+
+# set when the collection is interrupted, e.g. with ctrl+c
+INTERRUPTED = threading.Event()
+
+
+def check_interrupted():
+    """Raises KeyboardInterrupt if the collection was interrupted"""
+    if INTERRUPTED.is_set():
+        raise KeyboardInterrupt
+
+
+# the directories already created (or found) by create_directory
+_created_directories = set()
+
+
+def create_directory(directory):
+    """Creates the directory and its parents if they do not exist yet
+
+    The created directories are remembered, hence repeated calls
+    with the same directory do not access the file system.
+
+    Args:
+        directory (str): The path to the directory.
+    """
+    directory = os.path.normpath(directory)
+    if directory not in _created_directories:
+        # the directory might be created concurrently
+        os.makedirs(directory, exist_ok=True)
+        _created_directories.add(directory)
+
+
 def create_folder_directory(path):
     """Creates the folder structure associated with the `path`
     Args:
         path (str): The path to the given file.
     """
-    # get the folder structure path
-    normpath = os.path.normpath(path)
-    split_path = normpath.split(os.sep)
-    del split_path[-1]
-    # reconstruct the folder structure and create
-    # the directories if they do not exist yet
-    directory = os.sep.join(split_path)
-    if not os.path.exists(directory):
-        os.makedirs(directory)
-
-
-def save_as_array(file, articles):
+    directory = os.path.dirname(path)
+    # the file in the current directory does not need a folder
+    if directory:
+        create_directory(directory)
+
+
+def save_as_array(file, articles, buffer_size=1 << 20):
     """Save the articles as an array of objects
 
+    The array is serialized incrementally, hence the articles are
+    written while they are being acquired.
+
     Args:
-        file (obj): The file object to which we wish to write.
+        file (obj): The binary file object to which we wish to write.
         articles (iter): The iterator with all of the acquired
             articles.
+        buffer_size (int): The number of bytes collected before
+            they are written to the file (Default: 1 MB).
     """
-    json.dump([a for a in articles], file)
-
-
-def save_as_separate_line(file, articles):
+    buffer = bytearray(b"[")
+    separator = b""
+    try:
+        for article in articles:
+            # add the article json to the buffer
+            buffer += separator
+            buffer += json_dumps(article)
+            separator = b","
+            if len(buffer) >= buffer_size:
+                file.write(buffer)
+                buffer.clear()
+        # close the array
+        buffer += b"]"
+    finally:
+        # write the remaining articles, also when retrieving them fails
+        file.write(buffer)
+
+
+def save_as_separate_line(file, articles, buffer_size=1 << 20):
     """Saves the article objects in separate lines
 
+    The serialized articles are collected in a buffer which is
+    written to the file once it exceeds the buffer size.
+
     Args:
-        file (obj): The file object to which we wish to write.
+        file (obj): The binary file object to which we wish to write.
         articles (iter): The iterator with all of the acquired
             articles.
+        buffer_size (int): The number of bytes collected before
+            they are written to the file (Default: 1 MB).
     """
-    for article in articles:
-        try:
-            # write the article json to the file
-            json.dump(article, file)
-            file.write("\n")
-        except:
-            continue
+    buffer = bytearray()
+    try:
+        for article in articles:
+            try:
+                line = json_dumps(article)
+            except (TypeError, ValueError) as error:
+                # skip the articles that cannot be serialized
+                print(f"save_as_separate_line: skipping article: {error}")
+                continue
+            # add the article json to the buffer
+            buffer += line
+            buffer += b"\n"
+            if len(buffer) >= buffer_size:
+                file.write(buffer)
+                buffer.clear()
+    finally:
+        # write the remaining articles, also when retrieving them fails
+        if buffer:
+            file.write(buffer)
+
+
+# the functions storing the articles in the supported save formats
+SAVE_FORMATS = {
+    "array": save_as_array,
+    "ndjson": save_as_separate_line,
+}
 
 
 def save_result_in_file(articles, file_path, save_format=None):
@@ -80,32 +186,190 @@ def save_result_in_file(articles, file_path, save_format=None):
             articles (Default: None). Options:
                 'array' - The articles are wrapped into an array. Should not
                     be used when storing query results into the same file.
-                None - The articles are stored line-by-line in the file.
+                'ndjson' or None - The articles are stored line-by-line in the file.
 
     """
     # create the folder directory
     create_folder_directory(file_path)
-    # store the events
-    with open(file_path, "a") as f:
-        # save the
-        if save_format == "array":
-            save_as_array(f, articles)
-        else:
-            save_as_separate_line(f, articles)
+    # store the events while the next ones are being retrieved
+    with open(file_path, "ab") as f, BackgroundWriter(f) as writer:
+        save_as = SAVE_FORMATS.get(save_format, save_as_separate_line)
+        save_as(writer, articles)
+
+
+def read_file_chunk(fd, size, offset):
+    """Reads the chunk of the file at the given offset
+
+    Args:
+        fd (int): The file descriptor.
+        size (int): The number of bytes to read.
+        offset (int): The position in the file from which to read.
+
+    Returns:
+        bytes: The read chunk of the file.
+
+    """
+    if hasattr(os, "pread"):
+        return os.pread(fd, size, offset)
+    # os.pread is not available on Windows
+    os.lseek(fd, offset, os.SEEK_SET)
+    return os.read(fd, size)
+
+
+def read_last_json_line(path, chunk_size=8192):
+    """Reads and parses the last line of the file
+
+    The file is read backwards from its end in chunks, so only
+    the bytes of the last line are loaded into memory.
+
+    Args:
+        path (str): The path to the file.
+        chunk_size (int): The number of bytes read at once when
+            scanning the file (Default: 8192).
+
+    Returns:
+        obj: The object stored in the last line of the file. If the
+            file is empty, returns None.
+
+    """
+    # read the raw bytes without the overhead of a buffered file object
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        position = os.fstat(fd).st_size
+        tail = b""
+        while position > 0:
+            read_size = min(chunk_size, position)
+            position -= read_size
+            tail = read_file_chunk(fd, read_size, position) + tail
+            # ignore the trailing new lines when searching for the line start
+            newline = tail.rstrip().rfind(b"\n")
+            if newline != -1:
+                return json_loads(tail[newline + 1 :])
+    finally:
+        os.close(fd)
+
+    # the file contains a single line (or is empty)
+    return json_loads(tail) if tail.strip() else None
+
+
+# matches the event uri when it is the first attribute of the event object,
+# which avoids parsing the whole event just to get its id
+EVENT_URI_PATTERN = re.compile(rb'\s*\{\s*"uri"\s*:\s*"([^"\\]*)"')
+
+
+def read_event_ids(path, event_file_type="events"):
+    """Reads the event ids from the file line-by-line
+
+    Args:
+        path (str): The path to the file containing the event ids.
+        event_file_type (str): The event file type (Default: 'events'). Options:
+            - 'plain', where each line of the file contains a single event id
+            - 'events', where each line of the file contains an event registry event object
+                with the 'uri' attribute (used as the event id)
 
+    Yields:
+        str: The event id.
 
-def get_items(obj: ER.QueryItems):
+    """
+    with open(path, "rb") as f:
+        for line in f:
+            # skip the empty lines
+            if not line.strip():
+                continue
+            if event_file_type == "events":
+                # the line contains the whole event object, extract only the id
+                match = EVENT_URI_PATTERN.match(line)
+                if match:
+                    yield match.group(1).decode("utf-8").strip()
+                else:
+                    yield json_loads(line)["uri"].strip()
+            else:
+                # the line contains only the event id
+                yield line.decode("utf-8").strip()
+
+
+@lru_cache(maxsize=8)
+def load_event_ids(path, mtime_ns, event_file_type="events"):
+    """Loads the event ids from the file
+
+    The event ids are cached, hence the file is parsed again only
+    when it is modified.
+
+    Args:
+        path (str): The path to the file containing the event ids.
+        mtime_ns (int): The modification time of the file in nanoseconds,
+            used to invalidate the cached event ids.
+        event_file_type (str): The event file type (Default: 'events').
+            See `read_event_ids` for the options.
+
+    Returns:
+        tuple(str): The event ids.
+
+    """
+    return tuple(read_event_ids(path, event_file_type))
+
+
+def prefetch_items(items, max_pending=1000, stop_on_interrupt=False):
+    """Retrieves the items in a separate thread
+
+    The next pages of items are retrieved from Event Registry while
+    the already retrieved items are being processed, e.g. stored.
+
+    Args:
+        items (iter): The iterator with the items to retrieve.
+        max_pending (int): The maximum number of retrieved items
+            waiting to be processed (Default: 1000).
+        stop_on_interrupt (bool): If True, the retrieval stops after the
+            current item once the collection is interrupted. Otherwise, the
+            items iterator should stop itself, e.g. before requesting the
+            next page, so that no retrieved item is lost (Default: False).
+
+    Yields:
+        obj: The retrieved item.
+
+    """
+    pending = queue.Queue(maxsize=max_pending)
+    stopped = threading.Event()
+
+    def retrieve():
+        # each entry is a pair (is_item, item or error)
+        try:
+            for item in items:
+                pending.put((True, item))
+                if stopped.is_set():
+                    return
+                if stop_on_interrupt:
+                    check_interrupted()
+            pending.put((False, None))
+        except (Exception, KeyboardInterrupt) as error:
+            pending.put((False, error))
+
+    threading.Thread(target=retrieve, daemon=True).start()
+    try:
+        while True:
+            is_item, value = pending.get()
+            if not is_item:
+                if value is not None:
+                    raise value
+                return
+            yield value
+    finally:
+        stopped.set()
+        # release the thread in case it waits for a free slot
+        while not pending.empty():
+            pending.get_nowait()
+
+
+def get_items(obj: "ER.QueryItems"):
     return obj.getItems() if obj else obj
 
 
-def print_query_params(params):
-    keywords = get_items(params["keywords"])
-    concepts = get_items(params["concepts"])
-    categories = get_items(params["categories"])
-    sources = get_items(params["sources"])
-    date_start = params["date_start"]
-    date_end = params["date_end"]
-    languages = params["languages"]
+def print_query_params(query_items, date_start=None, date_end=None):
+    keywords = get_items(query_items["keywords"])
+    concepts = get_items(query_items["conceptUri"])
+    categories = get_items(query_items["categoryUri"])
+    sources = get_items(query_items["sourceUri"])
+    languages = get_items(query_items["lang"])
 
     message = f"""
         EVENT REGISTRY QUERY PARAMETERS
@@ -126,49 +390,81 @@ def print_query_params(params):
 #######################################
 
 
-class URI:
-    def __init__(self, keyword, uri):
-        """Initializes the keyword concept pair
-            used then in the event registry collector class
+class BackgroundWriter:
+    def __init__(self, file, max_pending=8):
+        """Initializes the writer which writes the data in a separate thread
+
+        The data is written to the file while the caller continues with
+        its work, e.g. retrieving the next page of articles.
 
         Args:
-            keyword (str): The source keyword for concept
-            concept (str): the wikipedia concept associated
-                with the source keyword
+            file (obj): The binary file object to which we wish to write.
+            max_pending (int): The maximum number of data chunks waiting
+                to be written. When reached, `write` blocks until a chunk
+                is written (Default: 8).
 
         """
-        self.__keyword = keyword
-        self.__uri = uri
-
-    def get_keyword(self):
-        """Gets the keyword value
+        self._file = file
+        self._error = None
+        self._queue = queue.Queue(maxsize=max_pending)
+        self._thread = threading.Thread(target=self._write_pending, daemon=True)
+        self._thread.start()
+
+    def _write_pending(self):
+        """Writes the queued data chunks until the writer is closed"""
+        while True:
+            data = self._queue.get()
+            if data is None:
+                break
+            # after an error the remaining chunks are discarded
+            if self._error is None:
+                try:
+                    self._file.write(data)
+                except Exception as error:
+                    self._error = error
+
+    def write(self, data):
+        """Queues the data to be written to the file
 
-        Returns:
-            str: the source keyword
+        Args:
+            data (bytes): The data to write. The data is copied, hence
+                the caller can reuse the provided buffer.
 
         """
-        return self.__keyword
+        if self._error is not None:
+            raise self._error
+        self._queue.put(bytes(data))
 
-    def get_uri(self):
-        """Gets the wikipedia concept
+    def close(self):
+        """Waits until all of the queued data is written to the file"""
+        self._queue.put(None)
+        self._thread.join()
+        if self._error is not None:
+            raise self._error
 
-        Returns:
-            str: the wikipedia concept
+    def __enter__(self):
+        return self
 
-        """
-        return self.__uri
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
-    def __eq__(self, other):
-        """Compares if the instances are the same"""
-        return self.__uri == other
 
-    def __ne__(self, other):
-        """Compares if the instances are not the same"""
-        return not self == other
+class URI(NamedTuple):
+    """The keyword and URI pair used in the event registry collector class
+
+    Attributes:
+        keyword (str): The source keyword.
+        uri (str): The event registry URI (e.g. the wikipedia concept)
+            associated with the source keyword.
+
+    """
+
+    keyword: str
+    uri: str
 
 
 class EventRegistryCollector:
-    def __init__(self, max_repeat_request=-1):
+    def __init__(self, max_repeat_request=-1, max_workers=8, api_key=None):
         """Initializes the event registry collector
 
         Args:
@@ -176,13 +472,132 @@ class EventRegistryCollector:
                 requests that can be repeated if something
                 goes wrong. If -1, repeat indefinately
                 (Default: -1)
+            max_workers (int): The maximum number of event
+                articles requests executed concurrently
+                (Default: 8)
+            api_key (str): The event registry API key.
+                If None, the key is loaded from the
+                environment (Default: None)
 
         """
-        # initialize the event registry instance
-        self._er = ER.EventRegistry(
-            apiKey=API_KEY, repeatFailedRequestCount=max_repeat_request
-        )
+        import eventregistry
+
+        # the event registry module, imported only once a collector is used
+        self._ER = eventregistry
+        self._api_key = api_key or get_api_key()
+        self._max_repeat_request = max_repeat_request
+        self._max_workers = max_workers
+        # the main client is created on first use, since creating it
+        # prints the connection details and requests the SDK version
+        self._main_client = None
+        # the clients available for concurrent requests, where
+        # the count includes the (not yet created) main client
+        self._clients = queue.SimpleQueue()
+        self._client_count = 1
+        self._client_lock = threading.Lock()
         self.MAX_EVENT_REQUESTS = 50
+        self.MAX_URI_WORKERS = 16
+        self.MAX_CLIENTS = 16
+        # the caches of the already resolved URIs
+        self._concept_cache = {}
+        self._category_cache = {}
+        self._source_cache = {}
+
+    @property
+    def _er(self):
+        """EventRegistry: The main event registry client, created on first use"""
+        with self._client_lock:
+            if self._main_client is None:
+                self._main_client = self._create_client()
+                self._clients.put(self._main_client)
+        return self._main_client
+
+    def _create_client(self):
+        """Creates a new event registry client
+
+        Returns:
+            EventRegistry: The event registry client.
+
+        """
+        return self._ER.EventRegistry(
+            apiKey=self._api_key, repeatFailedRequestCount=self._max_repeat_request
+        )
+
+    def _create_pooled_client(self):
+        """Creates an additional client for the concurrent requests
+
+        The client is a copy of the main client with its own lock and HTTP
+        session. Unlike a new client, it does not print the connection
+        details and request the latest SDK version again.
+
+        Returns:
+            EventRegistry: The event registry client.
+
+        """
+        import requests
+
+        client = copy.copy(self._er)
+        client._lock = threading.Lock()
+        client._reqSession = requests.Session()
+        return client
+
+    @contextmanager
+    def _borrow_client(self):
+        """Borrows an event registry client for the duration of a request
+
+        The event registry client executes one request at a time,
+        hence concurrent requests must each use their own client.
+        The clients are reused once they are returned to the pool.
+        At most `MAX_CLIENTS` clients are created, afterwards the
+        requests wait for a client to be returned.
+
+        Yields:
+            EventRegistry: The event registry client.
+
+        """
+        try:
+            client = self._clients.get_nowait()
+        except queue.Empty:
+            with self._client_lock:
+                create = self._client_count < self.MAX_CLIENTS
+                if create:
+                    self._client_count += 1
+            client = self._create_pooled_client() if create else self._clients.get()
+        try:
+            yield client
+        finally:
+            self._clients.put(client)
+
+    def _resolve_uris(self, get_uri, keywords, cache):
+        """Resolves the keywords into URIs with concurrent requests
+
+        The keywords already found in the cache are not requested again.
+
+        Args:
+            get_uri (function): The event registry method used to
+                retrieve the URI, e.g. `ER.EventRegistry.getConceptUri`.
+            keywords (list(str)): The list of keywords to resolve.
+            cache (dict): The cache mapping the keywords to their URIs.
+
+        Returns:
+            list(str): A list of URIs in the order of keywords.
+
+        """
+
+        def resolve(keyword):
+            with self._borrow_client() as client:
+                return get_uri(client, keyword)
+
+        # get the unique keywords that were not resolved yet
+        missing = [k for k in dict.fromkeys(keywords) if k not in cache]
+        if len(missing) == 1:
+            cache[missing[0]] = resolve(missing[0])
+        elif len(missing) > 1:
+            max_workers = min(self.MAX_URI_WORKERS, len(missing))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                cache.update(zip(missing, executor.map(resolve, missing)))
+
+        return [cache[k] for k in keywords]
 
     def get_concepts(self, concepts):
         """Get the list of event registry concepts
@@ -196,7 +611,21 @@ class EventRegistryCollector:
                 concept URIs.
 
         """
-        return [URI(k, self._er.getConceptUri(k)) for k in concepts]
+        return [URI(k, u) for k, u in zip(concepts, self._concept_uris(concepts))]
+
+    def _concept_uris(self, concepts):
+        """Get the list of concept URIs without wrapping them into URI objects
+
+        Args:
+            concepts (list(str)): The list of concepts.
+
+        Returns:
+            list(str): The list of concept URIs.
+
+        """
+        return self._resolve_uris(
+            self._ER.EventRegistry.getConceptUri, concepts, self._concept_cache
+        )
 
     def get_categories(self, categories):
         """Get the list of event registry concepts
@@ -210,7 +639,21 @@ class EventRegistryCollector:
                 categories URIs.
 
         """
-        return [URI(k, self._er.getCategoryUri(k)) for k in categories]
+        return [URI(k, u) for k, u in zip(categories, self._category_uris(categories))]
+
+    def _category_uris(self, categories):
+        """Get the list of category URIs without wrapping them into URI objects
+
+        Args:
+            categories (list(str)): The list of categories.
+
+        Returns:
+            list(str): The list of category URIs.
+
+        """
+        return self._resolve_uris(
+            self._ER.EventRegistry.getCategoryUri, categories, self._category_cache
+        )
 
     def get_sources(self, sources):
         """Get the list of source uris
@@ -224,7 +667,133 @@ class EventRegistryCollector:
                 source URIs.
 
         """
-        return [URI(k, self._er.getSourceUri(k)) for k in sources]
+        return [URI(k, u) for k, u in zip(sources, self._source_uris(sources))]
+
+    def _source_uris(self, sources):
+        """Get the list of source URIs without wrapping them into URI objects
+
+        Args:
+            sources (list(str)): The list of sources.
+
+        Returns:
+            list(str): The list of source URIs.
+
+        """
+        return self._resolve_uris(
+            self._ER.EventRegistry.getSourceUri, sources, self._source_cache
+        )
+
+    def _get_query_items(
+        self,
+        keywords=None,
+        concepts=None,
+        categories=None,
+        sources=None,
+        languages=None,
+    ):
+        """Prepares the query items used by the event registry queries
+
+        Args:
+            keywords (list(str)): The list of keywords (Default: None).
+            concepts (list(str)): The list of concepts (Default: None).
+            categories (list(str)): The list of categories (Default: None).
+            sources (list(str)): The list of sources (Default: None).
+            languages (list(str)): The list of languages (Default: None).
+
+        Returns:
+            dict: The query items passed as keyword arguments to the
+                event registry query objects.
+
+        """
+        return {
+            "keywords": self._ER.QueryItems.AND(keywords) if keywords else None,
+            "conceptUri": (
+                self._ER.QueryItems.AND(self._concept_uris(concepts))
+                if concepts
+                else None
+            ),
+            "categoryUri": (
+                self._ER.QueryItems.AND(self._category_uris(categories))
+                if categories
+                else None
+            ),
+            "sourceUri": (
+                self._ER.QueryItems.OR(self._source_uris(sources)) if sources else None
+            ),
+            "lang": self._ER.QueryItems.OR(languages) if languages else None,
+        }
+
+    def _run_query(
+        self,
+        query_class,
+        query_args,
+        query_items,
+        resume_field=None,
+        date_start=None,
+        date_end=None,
+        sort_by="date",
+        sort_by_asc=False,
+        max_items=-1,
+        save_to_file=None,
+        save_format=None,
+        verbose=False,
+    ):
+        """Executes the event registry query and stores the results
+
+        Args:
+            query_class (type): The event registry query iterator class,
+                e.g. `ER.QueryArticlesIter`.
+            query_args (tuple): The positional arguments of the query class.
+            query_items (dict): The query items prepared with `_get_query_items`.
+            resume_field (str): The attribute with the date of the retrieved
+                items. If provided and the `save_to_file` exists, the date of
+                its last item is used as the start date (Default: None).
+
+        The remaining arguments are the same as in `get_articles`.
+
+        Returns:
+            Iterator: The iterator which goes through all retrieved items.
+
+        """
+        # when saving to file check the last date and use it as start date
+        if resume_field and save_to_file and os.path.isfile(save_to_file):
+            last_item = read_last_json_line(save_to_file)
+            if last_item:
+                # check if last event in right location
+                date_start = last_item[resume_field]
+
+        if verbose:
+            print_query_params(query_items, date_start, date_end)
+
+        # creates the query object
+        q = query_class(
+            *query_args, dateStart=date_start, dateEnd=date_end, **query_items
+        )
+
+        if save_to_file:
+            # the queries can be executed concurrently, hence
+            # the query is executed with a dedicated client
+            with self._borrow_client() as client:
+                items = q.execQuery(
+                    client, sortBy=sort_by, sortByAsc=sort_by_asc, maxItems=max_items
+                )
+                # saves the items while the next ones are being retrieved
+                # the query iterators request the pages internally, hence they
+                # are stopped between the items; the saved file is resumed
+                # from its last item
+                save_result_in_file(
+                    prefetch_items(items, stop_on_interrupt=True),
+                    save_to_file,
+                    save_format,
+                )
+        else:
+            # execute the query and return the iterator
+            items = q.execQuery(
+                self._er, sortBy=sort_by, sortByAsc=sort_by_asc, maxItems=max_items
+            )
+
+        # return the items for other use
+        return items
 
     def get_articles(
         self,
@@ -275,76 +844,31 @@ class EventRegistryCollector:
                 Options:
                     'array' - The articles are wrapped into an array. Should not
                         be used when storing query results into the same file.
-                    None - The articles are stored line-by-line in the file.
+                    'ndjson' or None - The articles are stored line-by-line in the file.
 
         Returns:
             Iterator: The iterator which goes through all retrieved articles.
 
         """
         # setup the event registry parameters
-        er_keywords = ER.QueryItems.AND(keywords) if keywords else None
-        er_concepts = (
-            ER.QueryItems.AND([c.get_uri() for c in self.get_concepts(concepts)])
-            if concepts
-            else None
-        )
-        er_categories = (
-            ER.QueryItems.AND([c.get_uri() for c in self.get_categories(categories)])
-            if categories
-            else None
-        )
-        er_sources = (
-            ER.QueryItems.OR([c.get_uri() for c in self.get_sources(sources)])
-            if sources
-            else None
-        )
-        er_lang = ER.QueryItems.OR(languages) if languages else None
-
-        # when saving to file check the last date and use it as start date
-        if save_to_file and os.path.isfile(save_to_file):
-            with open(save_to_file) as in_file:
-                # get all lines
-                lines = in_file.readlines()
-                if len(lines) > 0:
-                    last_article = json.loads(lines[-1])
-                    # check if last event in right location
-                    date_start = last_article["date"]
-
-        if verbose:
-            print_query_params(
-                {
-                    "keywords": er_keywords,
-                    "concepts": er_concepts,
-                    "categories": er_categories,
-                    "sources": er_sources,
-                    "date_start": date_start,
-                    "date_end": date_end,
-                    "languages": languages,
-                }
-            )
-
-        # creates the query articles object
-        q = ER.QueryArticlesIter(
-            keywords=er_keywords,
-            conceptUri=er_concepts,
-            categoryUri=er_categories,
-            sourceUri=er_sources,
-            dateStart=date_start,
-            dateEnd=date_end,
-            lang=er_lang,
+        query_items = self._get_query_items(
+            keywords, concepts, categories, sources, languages
         )
-
-        # execute the query and return the iterator
-        articles = q.execQuery(
-            self._er, sortBy=sort_by, sortByAsc=sort_by_asc, maxItems=max_items
+        return self._run_query(
+            self._ER.QueryArticlesIter,
+            (),
+            query_items,
+            resume_field="date",
+            date_start=date_start,
+            date_end=date_end,
+            sort_by=sort_by,
+            sort_by_asc=sort_by_asc,
+            max_items=max_items,
+            save_to_file=save_to_file,
+            save_format=save_format,
+            verbose=verbose,
         )
 
-        if save_to_file:
-            save_result_in_file(articles, save_to_file, save_format)
-
-        # return the articles for other use
-        return articles
-
     def get_events(
         self,
         keywords=None,
@@ -394,77 +918,31 @@ class EventRegistryCollector:
                 Options:
                     'array' - The articles are wrapped into an array. Should not
                         be used when storing query results into the same file.
-                    None - The articles are stored line-by-line in the file.
+                    'ndjson' or None - The articles are stored line-by-line in the file.
 
         Returns:
             Iterator: The iterator which goes through all retrieved articles.
 
         """
         # setup the event registry parameters
-        er_keywords = ER.QueryItems.AND(keywords) if keywords else None
-        er_concepts = (
-            ER.QueryItems.AND([c.get_uri() for c in self.get_concepts(concepts)])
-            if concepts
-            else None
-        )
-        er_categories = (
-            ER.QueryItems.AND([c.get_uri() for c in self.get_categories(categories)])
-            if categories
-            else None
-        )
-        er_sources = (
-            ER.QueryItems.OR([c.get_uri() for c in self.get_sources(sources)])
-            if sources
-            else None
-        )
-        er_lang = ER.QueryItems.OR(languages) if languages else None
-
-        # when saving to file check the last date and use it as start date
-        if save_to_file and os.path.isfile(save_to_file):
-            with open(save_to_file) as in_file:
-                # get all lines
-                lines = in_file.readlines()
-                if len(lines) > 0:
-                    last_article = json.loads(lines[-1])
-                    # check if last event in right location
-                    date_start = last_article["eventDate"]
-
-        if verbose:
-            print_query_params(
-                {
-                    "keywords": er_keywords,
-                    "concepts": er_concepts,
-                    "categories": er_categories,
-                    "sources": er_sources,
-                    "date_start": date_start,
-                    "date_end": date_end,
-                    "languages": languages,
-                }
-            )
-
-        # creates the query articles object
-        q = ER.QueryEventsIter(
-            keywords=er_keywords,
-            conceptUri=er_concepts,
-            categoryUri=er_categories,
-            sourceUri=er_sources,
-            dateStart=date_start,
-            dateEnd=date_end,
-            lang=er_lang,
+        query_items = self._get_query_items(
+            keywords, concepts, categories, sources, languages
         )
-
-        # execute the query and return the iterator
-        events = q.execQuery(
-            self._er, sortBy=sort_by, sortByAsc=sort_by_asc, maxItems=max_items
+        return self._run_query(
+            self._ER.QueryEventsIter,
+            (),
+            query_items,
+            resume_field="eventDate",
+            date_start=date_start,
+            date_end=date_end,
+            sort_by=sort_by,
+            sort_by_asc=sort_by_asc,
+            max_items=max_items,
+            save_to_file=save_to_file,
+            save_format=save_format,
+            verbose=verbose,
         )
 
-        if save_to_file:
-            # saves the events into
-            save_result_in_file(events, save_to_file, save_format)
-
-        # return the events for other use
-        return events
-
     def get_event(self, event_ids, save_to_file=None, save_format=None):
         """Get the events with the provided event IDs
 
@@ -479,7 +957,7 @@ class EventRegistryCollector:
                 Options:
                     'array' - The articles are wrapped into an array. Should not
                         be used when storing query results into the same file.
-                    None - The articles are stored line-by-line in the file.
+                    'ndjson' or None - The articles are stored line-by-line in the file.
 
         Returns:
             List: The list with the retrieved events.
@@ -488,26 +966,34 @@ class EventRegistryCollector:
         query_queue = []
         if type(event_ids) is list:
             # split the list into chunks of at most 50 event ids
-            chunk_number = len(event_ids) % self.MAX_EVENT_REQUESTS
-            for i in range(chunk_number + 1):
-                start = self.MAX_EVENT_REQUESTS * i
-                end = self.MAX_EVENT_REQUESTS * (i + 1)
-                query_queue.append(ER.QueryEvent(event_ids[start:end]))
+            for start in range(0, len(event_ids), self.MAX_EVENT_REQUESTS):
+                end = start + self.MAX_EVENT_REQUESTS
+                query_queue.append(self._ER.QueryEvent(event_ids[start:end]))
         elif type(event_ids) is str:
-            query_queue.append(ER.QueryEvent(event_ids))
+            query_queue.append(self._ER.QueryEvent(event_ids))
         else:
             raise Exception("get_event: event_ids is not a list or a string")
 
-        # go through the query queue and execute the requests
         events = []
-        for query in query_queue:
-            response = self._er.execQuery(query)
-            events.extend(
-                [obj["info"] for obj in list(response.values()) if "info" in obj]
-            )
+
+        def iterate_events():
+            # go through the query queue and execute the requests
+            for query in query_queue:
+                check_interrupted()
+                response = self._er.execQuery(query)
+                chunk = [obj["info"] for obj in response.values() if "info" in obj]
+                events.extend(chunk)
+                yield from chunk
 
         if save_to_file:
-            save_result_in_file(events, save_to_file, save_format)
+            # store the events of each request while the next one is executed
+            save_result_in_file(
+                prefetch_items(iterate_events()), save_to_file, save_format
+            )
+        else:
+            # only execute the requests
+            for _ in iterate_events():
+                pass
 
         # return the events for other use
         return events
@@ -564,67 +1050,89 @@ class EventRegistryCollector:
                 Options:
                     'array' - The articles are wrapped into an array. Should not
                         be used when storing query results into the same file.
-                    None - The articles are stored line-by-line in the file.
+                    'ndjson' or None - The articles are stored line-by-line in the file.
 
         Returns:
             Iterator: The iterator which goes through all retrieved articles.
 
         """
         # setup the event registry parameters
-        er_keywords = ER.QueryItems.AND(keywords) if keywords else None
-        er_concepts = (
-            ER.QueryItems.AND([c.get_uri() for c in self.get_concepts(concepts)])
-            if concepts
-            else None
+        query_items = self._get_query_items(
+            keywords, concepts, categories, sources, languages
         )
-        er_categories = (
-            ER.QueryItems.AND([c.get_uri() for c in self.get_categories(categories)])
-            if categories
-            else None
+        return self._run_query(
+            self._ER.QueryEventArticlesIter,
+            (event_id,),
+            query_items,
+            date_start=date_start,
+            date_end=date_end,
+            sort_by=sort_by,
+            sort_by_asc=sort_by_asc,
+            max_items=max_items,
+            save_to_file=save_to_file,
+            save_format=save_format,
+            verbose=verbose,
         )
-        er_sources = (
-            ER.QueryItems.OR([c.get_uri() for c in self.get_sources(sources)])
-            if sources
-            else None
+
+    def _get_event_articles_first_pages(self, event_ids, request_args):
+        """Gets the first page of articles of multiple events with one request
+
+        Args:
+            event_ids (list(str)): The event ids, at most `MAX_EVENT_REQUESTS`.
+            request_args (dict): The arguments of `ER.RequestEventArticles`.
+
+        Returns:
+            dict: The mapping from the event id to the tuple containing the
+                articles of the first page and the number of article pages.
+
+        """
+        check_interrupted()
+        q = self._ER.QueryEvent(
+            event_ids,
+            requestedResult=self._ER.RequestEventArticles(page=1, **request_args),
         )
-        er_lang = ER.QueryItems.OR(languages) if languages else None
+        with self._borrow_client() as client:
+            response = client.execQuery(q)
+        if "error" in response:
+            print(response["error"])
 
-        if verbose:
-            print_query_params(
-                {
-                    "keywords": er_keywords,
-                    "concepts": er_concepts,
-                    "categories": er_categories,
-                    "sources": er_sources,
-                    "date_start": date_start,
-                    "date_end": date_end,
-                    "languages": languages,
-                }
+        first_pages = {}
+        for event_id in event_ids:
+            articles = response.get(event_id, {}).get("articles", {})
+            first_pages[event_id] = (
+                articles.get("results", []),
+                articles.get("pages", 0),
             )
+        return first_pages
 
-        # creates the query event articles object
-        q = ER.QueryEventArticlesIter(
-            event_id,
-            keywords=er_keywords,
-            conceptUri=er_concepts,
-            categoryUri=er_categories,
-            sourceUri=er_sources,
-            dateStart=date_start,
-            dateEnd=date_end,
-            lang=er_lang,
-        )
+    def _iterate_event_articles(self, client, event_id, articles, pages, request_args):
+        """Iterates through the event articles following the first page
 
-        # execute the query and return the iterator
-        articles = q.execQuery(
-            self._er, sortBy=sort_by, sortByAsc=sort_by_asc, maxItems=max_items
-        )
+        Args:
+            client (EventRegistry): The client used to retrieve the pages.
+            event_id (str): The event id.
+            articles (list(dict)): The articles of the first page.
+            pages (int): The number of article pages of the event.
+            request_args (dict): The arguments of `ER.RequestEventArticles`.
 
-        if save_to_file:
-            # saves the articles into
-            save_result_in_file(articles, save_to_file, save_format)
+        Yields:
+            dict: The event article.
 
-        # return the articles for other use
-        return articles
+        """
+        yield from articles
+        for page in range(2, pages + 1):
+            check_interrupted()
+            q = self._ER.QueryEvent(
+                event_id,
+                requestedResult=self._ER.RequestEventArticles(
+                    page=page, **request_args
+                ),
+            )
+            response = client.execQuery(q)
+            if "error" in response:
+                print(response["error"])
+                return
+            yield from response.get(event_id, {}).get("articles", {}).get("results", [])
 
     def get_event_articles_from_file(
         self,
@@ -643,6 +1151,8 @@ class EventRegistryCollector:
         save_to_folder=None,
         save_format=None,
         verbose=False,
+        batch_size=25,
+        concurrency=None,
     ):
         """Gets the event articles from a list of event ids stored in a
             separate file and store them in their own event json file.
@@ -681,250 +1191,301 @@ class EventRegistryCollector:
             save_format (str): The format in which the articles are stored. (Default: None)
                 Options:
                     'array' - The articles are wrapped into an array.
-                    None - The articles are stored line-by-line in the file.
+                    'ndjson' or None - The articles are stored line-by-line in the file.
+            verbose (bool): If True, prints the query parameters (Default: False).
+            batch_size (int): The number of events whose first page of articles
+                is retrieved with a single request. It is limited to the maximum
+                number of events supported in a request (Default: 25).
+            concurrency (int): The maximum number of concurrent requests. If None,
+                the `max_workers` of the collector is used (Default: None).
+
+        Returns:
+            Iterator: The iterator which goes through the events and their
+                articles. The events are provided in the order in which their
+                articles were collected.
 
         """
         # check if the event ids file exists
         if not (event_ids_file and os.path.isfile(event_ids_file)):
             raise Exception("get_event_articles_list: event_ids_file doesn't exist")
 
-        # open the file with the given event ids
-        event_ids = []
-        with open(event_ids_file, "r") as f:
-            lines = f.readlines()
+        event_ids_stat = os.stat(event_ids_file)
+        if event_ids_stat.st_size == 0:
+            raise Exception("get_event_articles_list: event_ids_file is empty")
 
-            if len(lines) == 0:
-                raise Exception("get_event_articles_list: event_ids_file is empty")
+        if save_to_folder:
+            # create the folder once for all of the event files
+            create_directory(save_to_folder)
 
-            if event_file_type == "events":
-                # the file contains whole event objects, extract only the ids
-                for line in lines:
-                    line = json.loads(line)
-                    event_ids.append(line["uri"].strip())
+        # the query items are the same for all events, hence prepare them once
+        query_items = self._get_query_items(
+            keywords, concepts, categories, sources, languages
+        )
+
+        if verbose:
+            print_query_params(query_items, date_start, date_end)
+
+        # the arguments of the event articles requests
+        request_args = dict(
+            dateStart=date_start,
+            dateEnd=date_end,
+            sortBy=sort_by,
+            sortByAsc=sort_by_asc,
+            **query_items,
+        )
+        if 0 < max_items < 100:
+            # do not retrieve more articles than needed
+            request_args["count"] = max_items
+
+        # the number of events whose articles are requested together
+        batch_size = max(1, min(batch_size, self.MAX_EVENT_REQUESTS))
+
+        # the number of concurrent requests
+        concurrency = max(1, concurrency or self._max_workers)
+
+        def collect_event_articles(event_id, first_page):
+            # do not start collecting the queued events once interrupted
+            check_interrupted()
+
+            def get_articles(client):
+                articles = self._iterate_event_articles(
+                    client, event_id, *first_page, request_args
+                )
+                return islice(articles, max_items) if max_items >= 0 else articles
+
+            if save_to_folder:
+                # setup the event path
+                event_path = f"{save_to_folder}/{event_id}.json"
+                # the remaining pages are retrieved with a dedicated client
+                with self._borrow_client() as client:
+                    articles = get_articles(client)
+                    # saves the articles while the next ones are being retrieved
+                    save_result_in_file(
+                        prefetch_items(articles), event_path, save_format
+                    )
             else:
-                # each line of the file is a separate event id
-                for line in lines:
-                    event_ids.append(line.strip())
+                articles = get_articles(self._er)
+
+            # provide the articles and the event id
+            return {"event_id": event_id, "articles": articles}
+
+        def iterate_event_articles():
+            # the events are independent and are stored in separate
+            # files, hence their articles are collected concurrently
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                # the requests of the first pages of the event batches
+                batches = set()
+                pending = set()
+
+                def complete(max_pending):
+                    nonlocal pending
+                    while len(pending) > max_pending:
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            if future not in batches:
+                                yield future.result()
+                                continue
+                            # collect the remaining pages of each event
+                            batches.remove(future)
+                            for event_id, first_page in future.result().items():
+                                pending.add(
+                                    executor.submit(
+                                        collect_event_articles, event_id, first_page
+                                    )
+                                )
+
+                # the event ids are parsed only when the file is modified
+                event_ids = iter(
+                    load_event_ids(
+                        event_ids_file, event_ids_stat.st_mtime_ns, event_file_type
+                    )
+                )
+                while batch := list(islice(event_ids, batch_size)):
+                    future = executor.submit(
+                        self._get_event_articles_first_pages, batch, request_args
+                    )
+                    batches.add(future)
+                    pending.add(future)
+                    # wait for the workers before requesting more events
+                    yield from complete(concurrency - 1)
+
+                yield from complete(0)
+
+        # return the iterator over the event articles
+        return iterate_event_articles()
+
+
+@lru_cache(maxsize=4)
+def get_collector(api_key=None, max_repeat_request=-1):
+    """Gets the event registry collector with the given configuration
+
+    The collectors are cached, hence the collectors with the same
+    configuration share their clients and the resolved URIs.
 
-        event_articles = []
+    Args:
+        api_key (str): The event registry API key. If None, the key
+            is loaded from the environment (Default: None).
+        max_repeat_request (int): The number of maximum requests that
+            can be repeated if something goes wrong (Default: -1).
 
-        for event_id in event_ids:
-            # setup the event path
-            event_path = (
-                "{}/{}.json".format(save_to_folder, event_id)
-                if save_to_folder
-                else None
-            )
+    Returns:
+        EventRegistryCollector: The event registry collector.
 
-            # get the event articles
-            articles = self.get_event_articles(
-                event_id,
-                keywords,
-                concepts,
-                categories,
-                sources,
-                languages,
-                date_start,
-                date_end,
-                sort_by,
-                sort_by_asc,
-                max_items,
-                event_path,
-                save_format,
-            )
+    """
+    return EventRegistryCollector(
+        max_repeat_request=max_repeat_request, api_key=api_key
+    )
 
-            # store the articles and the event id
-            event_articles.append({"event_id": event_id, "articles": articles})
 
-        # return the list of event articles
-        return event_articles
+def parse_comma_separated(value):
+    """Splits the comma separated command line values
 
+    Args:
+        value (str | list(str)): The comma separated values, or the list of
+            them when the argument is provided multiple times.
 
-def main() -> None:
-    # parse command line arguments
-    argparser = argparse.ArgumentParser(
-        description="Service for retrieving event registry articles"
-    )
+    Returns:
+        list(str): The list of stripped values without the empty ones.
+            If there are no values, returns None.
 
-    subparsers = argparser.add_subparsers(help="command")
+    """
+    if isinstance(value, str):
+        value = [value]
+    values = [v.strip() for item in value or () for v in item.split(",")]
+    return [v for v in values if v] or None
 
-    ###################################
-    # Articles Query
-    ###################################
 
-    subparser = subparsers.add_parser(
-        "articles", help="Collects the articles based on some parameters"
-    )
-    subparser.set_defaults(action="articles")
+# the (lowercase) command line values parsed as true
+TRUE_VALUES = frozenset(("1", "t", "true", "y", "yes"))
 
-    subparser.add_argument(
-        "--max_repeat_request",
-        type=int,
-        default=-1,
-        help="The maximum number of repeated requests",
-    )
 
-    # query related attributes
-    subparser.add_argument(
-        "--keywords",
-        type=str,
-        default=None,
-        help="The comma separated keywords the articles should contain",
-    )
-    subparser.add_argument(
-        "--concepts",
-        type=str,
-        default=None,
-        help="The comma separated concepts the articles should be associated with",
-    )
-    subparser.add_argument(
-        "--categories",
-        type=str,
-        default=None,
-        help="The comma separated categories of the collected articles",
-    )
-    subparser.add_argument(
-        "--sources",
-        type=str,
-        default=None,
-        help="The comma separated media sources that published the articles",
-    )
-    subparser.add_argument(
-        "--languages",
-        type=str,
-        default=None,
-        help="The comma separated languages of the articles",
-    )
-    subparser.add_argument(
-        "--date_start", type=str, default=None, help="The start date of the articles"
-    )
-    subparser.add_argument(
-        "--date_end", type=str, default=None, help="The end date of the articles"
-    )
-    # data retrieving attributes
-    subparser.add_argument(
-        "--sort_by", type=str, default="date", help="The sort order of articles"
-    )
-    subparser.add_argument(
-        "--sort_by_asc", type=bool, default=True, help="The direction of the sort"
-    )
-    subparser.add_argument(
-        "--max_items", type=int, default=-1, help="The number of articles to collect"
-    )
-    # data storing values
-    subparser.add_argument(
-        "--save_to_file",
-        type=str,
-        default=None,
-        help="The path to the file to store the articles",
-    )
-    subparser.add_argument(
-        "--save_format",
-        type=str,
-        default=None,
-        help="The format in which to store the articles",
-    )
+def parse_bool(value):
+    """Parses the boolean command line value
 
-    subparser.add_argument(
-        "--verbose",
-        type=bool,
-        default=False,
-        help="If true, output the query parameters retrieved by ER",
-    )
+    Args:
+        value (str): The boolean value, e.g. 'true', 'false', '1', '0'.
 
-    ###################################
-    # Events Query
-    ###################################
+    Returns:
+        bool: True if the value is one of '1', 't', 'true', 'y' or 'yes'
+            (case insensitive), otherwise False.
 
-    subparser = subparsers.add_parser(
-        "events", help="Collects the events based on some parameters"
-    )
-    subparser.set_defaults(action="events")
+    """
+    return str(value).lower() in TRUE_VALUES
+
+
+# the list query arguments shared by the collecting actions, where
+# {items} is replaced with the name of the collected items
+QUERY_ARGUMENTS = (
+    ("keywords", "The comma separated keywords the {items} should contain"),
+    ("concepts", "The comma separated concepts the {items} should be associated with"),
+    ("categories", "The comma separated categories of the collected {items}"),
+    ("sources", "The comma separated media sources that published the {items}"),
+    ("languages", "The comma separated languages of the {items}"),
+)
+
+
+# the sort orders supported by the event registry queries
+ARTICLES_SORT_BY = (
+    "date",
+    "rel",
+    "id",
+    "cosSim",
+    "sourceImportance",
+    "sourceImportanceRank",
+    "sourceAlexaGlobalRank",
+    "sourceAlexaCountryRank",
+    "socialScore",
+    "facebookShares",
+)
+EVENTS_SORT_BY = ("date", "rel", "size", "socialScore", "none")
+EVENT_ARTICLES_SORT_BY = ARTICLES_SORT_BY + ("none",)
+
+
+def add_query_arguments(
+    subparser, items, sort_by_choices, sort_by="date", save_to_help=None
+):
+    """Adds the arguments shared by the collecting actions to the subparser
 
+    Args:
+        subparser (ArgumentParser): The subparser of the action.
+        items (str): The name of the collected items used in the help
+            messages, e.g. 'articles'.
+        sort_by_choices (tuple(str)): The supported sort orders of the items.
+        sort_by (str): The default sort order of the items (Default: 'date').
+        save_to_help (str): The help message of the `--save_to_file`
+            argument. If None, a generic message is used (Default: None).
+    """
     subparser.add_argument(
         "--max_repeat_request",
         type=int,
         default=-1,
         help="The maximum number of repeated requests",
     )
-
     # query related attributes
+    for name, message in QUERY_ARGUMENTS:
+        # the values can also be provided by repeating the argument
+        subparser.add_argument(
+            f"--{name}",
+            type=str,
+            action="append",
+            default=None,
+            help=message.format(items=items) + " (can be repeated)",
+        )
     subparser.add_argument(
-        "--keywords",
-        type=str,
-        default=None,
-        help="The comma separated keywords the events should contain",
-    )
-    subparser.add_argument(
-        "--concepts",
-        type=str,
-        default=None,
-        help="The comma separated concepts the events should be associated with",
-    )
-    subparser.add_argument(
-        "--categories",
-        type=str,
-        default=None,
-        help="The comma separated categories of the collected events",
-    )
-    subparser.add_argument(
-        "--sources",
-        type=str,
-        default=None,
-        help="The comma separated media sources that published the events",
-    )
-    subparser.add_argument(
-        "--languages",
-        type=str,
-        default=None,
-        help="The comma separated languages of the events",
-    )
-    subparser.add_argument(
-        "--date_start", type=str, default=None, help="The start date of the events"
+        "--date_start", type=str, default=None, help=f"The start date of the {items}"
     )
     subparser.add_argument(
-        "--date_end", type=str, default=None, help="The end date of the events"
+        "--date_end", type=str, default=None, help=f"The end date of the {items}"
     )
     # data retrieving attributes
     subparser.add_argument(
-        "--sort_by", type=str, default="date", help="The sort order of events"
+        "--sort_by",
+        type=str,
+        default=sort_by,
+        choices=sort_by_choices,
+        help=f"The sort order of {items}",
     )
     subparser.add_argument(
-        "--sort_by_asc", type=bool, default=True, help="The direction of the sort"
+        "--sort_by_asc", type=parse_bool, default=True, help="The direction of the sort"
     )
     subparser.add_argument(
-        "--max_items", type=int, default=-1, help="The number of events to collect"
+        "--max_items", type=int, default=-1, help=f"The number of {items} to collect"
     )
     # data storing values
     subparser.add_argument(
         "--save_to_file",
         type=str,
         default=None,
-        help="The path to the file to store the events",
+        help=save_to_help or f"The path to the file to store the {items}",
     )
     subparser.add_argument(
         "--save_format",
         type=str,
         default=None,
-        help="The format in which to store the events",
+        choices=SAVE_FORMATS,
+        help=f"The format in which to store the {items}",
     )
 
     subparser.add_argument(
         "--verbose",
-        type=bool,
+        type=parse_bool,
         default=False,
         help="If true, output the query parameters retrieved by ER",
     )
 
-    ###################################
-    # Event Query
-    ###################################
 
-    subparser = subparsers.add_parser(
-        "event", help="Collects the events based on some parameters"
-    )
-    subparser.set_defaults(action="event")
+def add_articles_arguments(subparser):
+    """Adds the arguments of the articles action"""
+    add_query_arguments(subparser, "articles", ARTICLES_SORT_BY)
 
+
+def add_events_arguments(subparser):
+    """Adds the arguments of the events action"""
+    add_query_arguments(subparser, "events", EVENTS_SORT_BY)
+
+
+def add_event_arguments(subparser):
+    """Adds the arguments of the event action"""
     subparser.add_argument(
         "--max_repeat_request",
         type=int,
@@ -947,25 +1508,13 @@ def main() -> None:
         "--save_format",
         type=str,
         default=None,
+        choices=SAVE_FORMATS,
         help="The format in which to store the events",
     )
 
-    ###################################
-    # Event Articles Query
-    ###################################
-
-    subparser = subparsers.add_parser(
-        "event_articles", help="Collects the event articles based on some parameters"
-    )
-    subparser.set_defaults(action="event_articles")
-
-    subparser.add_argument(
-        "--max_repeat_request",
-        type=int,
-        default=-1,
-        help="The maximum number of repeated requests",
-    )
 
+def add_event_articles_arguments(subparser):
+    """Adds the arguments of the event articles action"""
     # query related attributes
     subparser.add_argument(
         "--event_id",
@@ -973,96 +1522,13 @@ def main() -> None:
         default=None,
         help="The event id of the event for which we wish the articles",
     )
-    subparser.add_argument(
-        "--keywords",
-        type=str,
-        default=None,
-        help="The comma separated keywords the event articles should contain",
-    )
-    subparser.add_argument(
-        "--concepts",
-        type=str,
-        default=None,
-        help="The comma separated concepts the event articles should be associated with",
-    )
-    subparser.add_argument(
-        "--categories",
-        type=str,
-        default=None,
-        help="The comma separated categories of the collected event articles",
-    )
-    subparser.add_argument(
-        "--sources",
-        type=str,
-        default=None,
-        help="The comma separated media sources that published the event articles",
-    )
-    subparser.add_argument(
-        "--languages",
-        type=str,
-        default=None,
-        help="The comma separated languages of the event articles",
-    )
-    subparser.add_argument(
-        "--date_start",
-        type=str,
-        default=None,
-        help="The start date of the event articles",
-    )
-    subparser.add_argument(
-        "--date_end", type=str, default=None, help="The end date of the event articles"
-    )
-    # data retrieving attributes
-    subparser.add_argument(
-        "--sort_by", type=str, default="rel", help="The sort order of event articles"
-    )
-    subparser.add_argument(
-        "--sort_by_asc", type=bool, default=True, help="The direction of the sort"
-    )
-    subparser.add_argument(
-        "--max_items",
-        type=int,
-        default=-1,
-        help="The number of event articles to collect",
-    )
-    # data storing values
-    subparser.add_argument(
-        "--save_to_file",
-        type=str,
-        default=None,
-        help="The path to the file to store the event articles",
-    )
-    subparser.add_argument(
-        "--save_format",
-        type=str,
-        default=None,
-        help="The format in which to store the event articles",
-    )
-
-    subparser.add_argument(
-        "--verbose",
-        type=bool,
-        default=False,
-        help="If true, output the query parameters retrieved by ER",
+    add_query_arguments(
+        subparser, "event articles", EVENT_ARTICLES_SORT_BY, sort_by="rel"
     )
 
-    ###################################
-    # Event Articles List Query
-    ###################################
-
-    subparser = subparsers.add_parser(
-        "event_articles_from_file",
-        help="Collects the event articles from a file and based on some parameters",
-    )
-    subparser.set_defaults(action="event_articles_from_file")
-
-    subparser.add_argument(
-        "--max_repeat_request",
-        type=int,
-        default=-1,
-        help="The maximum number of repeated requests",
-    )
 
+def add_event_articles_from_file_arguments(subparser):
+    """Adds the arguments of the event articles from file action"""
     # query related attributes
     subparser.add_argument(
         "--event_ids_file",
@@ -1076,243 +1542,278 @@ def main() -> None:
         default="events",
         help="The type of the event file type. Options: 'events', 'plain'",
     )
-    subparser.add_argument(
-        "--keywords",
-        type=str,
-        default=None,
-        help="The comma separated keywords the event articles should contain",
-    )
-    subparser.add_argument(
-        "--concepts",
-        type=str,
-        default=None,
-        help="The comma separated concepts the event articles should be associated with",
-    )
-    subparser.add_argument(
-        "--categories",
-        type=str,
-        default=None,
-        help="The comma separated categories of the collected event articles",
-    )
-    subparser.add_argument(
-        "--sources",
-        type=str,
-        default=None,
-        help="The comma separated media sources that published the event articles",
-    )
-    subparser.add_argument(
-        "--languages",
-        type=str,
-        default=None,
-        help="The comma separated languages of the event articles",
-    )
-    subparser.add_argument(
-        "--date_start",
-        type=str,
-        default=None,
-        help="The start date of the event articles",
-    )
-    subparser.add_argument(
-        "--date_end", type=str, default=None, help="The end date of the event articles"
-    )
-    # data retrieving attributes
-    subparser.add_argument(
-        "--sort_by", type=str, default="rel", help="The sort order of event articles"
-    )
-    subparser.add_argument(
-        "--sort_by_asc", type=bool, default=True, help="The direction of the sort"
+    add_query_arguments(
+        subparser,
+        "event articles",
+        EVENT_ARTICLES_SORT_BY,
+        sort_by="rel",
+        save_to_help="The path to the folder to store the event articles files",
     )
     subparser.add_argument(
-        "--max_items",
+        "--batch_size",
         type=int,
-        default=-1,
-        help="The number of event articles to collect",
-    )
-    # data storing values
-    subparser.add_argument(
-        "--save_to_file",
-        type=str,
-        default=None,
-        help="The path to the folder to store the event articles files",
+        default=25,
+        help="The number of events whose articles are requested together",
     )
     subparser.add_argument(
-        "--save_format",
-        type=str,
-        default=None,
-        help="The format in which to store the event articles",
-    )
+        "--concurrency",
+        type=int,
+        default=4,
+        help="The maximum number of concurrent requests",
+    )
+
+
+# the description of the command line interface
+DESCRIPTION = "Service for retrieving event registry articles"
+
+# the help message of the API key argument
+API_KEY_HELP = "The event registry API key (Default: $EVENT_REGISTRY_API_KEY)"
+
+# the supported actions: (help message, function adding the action arguments)
+ACTIONS = {
+    "articles": (
+        "Collects the articles based on some parameters",
+        add_articles_arguments,
+    ),
+    "events": (
+        "Collects the events based on some parameters",
+        add_events_arguments,
+    ),
+    "event": (
+        "Collects the events based on some parameters",
+        add_event_arguments,
+    ),
+    "event_articles": (
+        "Collects the event articles based on some parameters",
+        add_event_articles_arguments,
+    ),
+    "event_articles_from_file": (
+        "Collects the event articles from a file and based on some parameters",
+        add_event_articles_from_file_arguments,
+    ),
+}
+
+
+def format_usage(prog):
+    """Formats the general usage of the program
 
-    subparser.add_argument(
-        "--verbose",
-        type=bool,
-        default=False,
-        help="If true, output the query parameters retrieved by ER",
-    )
+    Args:
+        prog (str): The name of the program.
 
-    try:
-        # parse the arguments and call whatever function was selected
-        args = argparser.parse_args()
+    Returns:
+        str: The general usage.
 
-        # event registry API values
-        max_repeat_request = args.max_repeat_request
+    """
+    return USAGE % {"prog": prog, "indent": " " * len(f"usage: {prog} ")}
 
-        # query related attributes
-        keywords = (
-            [k.strip() for k in args.keywords.split(",")]
-            if hasattr(args, "keywords") and args.keywords
-            else None
-        )
-        concepts = (
-            [c.strip() for c in args.concepts.split(",")]
-            if hasattr(args, "concepts") and args.concepts
-            else None
-        )
-        categories = (
-            [c.strip() for c in args.categories.split(",")]
-            if hasattr(args, "categories") and args.categories
-            else None
-        )
-        sources = (
-            [s.strip() for s in args.sources.split(",")]
-            if hasattr(args, "sources") and args.sources
-            else None
-        )
-        languages = (
-            [l.strip() for l in args.languages.split(",")]
-            if hasattr(args, "languages") and args.languages
-            else None
-        )
-        date_start = (
-            args.date_start if hasattr(args, "date_start") and args.date_start else None
-        )
-        date_end = (
-            args.date_end if hasattr(args, "date_end") and args.date_end else None
-        )
-        # data retrieving attributes
-        sort_by = args.sort_by if hasattr(args, "sort_by") and args.sort_by else None
-        sort_by_asc = (
-            args.sort_by_asc in [True, "True", "true", "1", "t", "y"]
-            if hasattr(args, "sort_by_asc") and args.sort_by_asc
-            else None
-        )
-        max_items = (
-            args.max_items if hasattr(args, "max_items") and args.max_items else None
-        )
-        # data storing values
-        save_to_file = (
-            args.save_to_file
-            if hasattr(args, "save_to_file") and args.save_to_file
-            else None
-        )
-        save_format = (
-            args.save_format
-            if hasattr(args, "save_format") and args.save_format
-            else None
+
+class UsageAction(argparse.Action):
+    """Prints the general usage without formatting the parser help"""
+
+    def __init__(self, option_strings, dest, **kwargs):
+        super().__init__(
+            option_strings,
+            dest,
+            nargs=0,
+            default=argparse.SUPPRESS,
+            help="show this help message and exit",
         )
 
-        verbose = args.verbose if hasattr(args, "verbose") and args.verbose else None
-
-        # initialize and execute query
-        er = EventRegistryCollector(max_repeat_request=max_repeat_request)
-
-        if args.action == "articles":
-            # execute the articles query
-            er.get_articles(
-                keywords=keywords,
-                concepts=concepts,
-                categories=categories,
-                sources=sources,
-                languages=languages,
-                date_start=date_start,
-                date_end=date_end,
-                sort_by=sort_by,
-                sort_by_asc=sort_by_asc,
-                max_items=max_items,
-                save_to_file=save_to_file,
-                save_format=save_format,
-                verbose=verbose,
-            )
+    def __call__(self, parser, namespace, values, option_string=None):
+        print(format_usage(parser.prog))
+        parser.exit()
 
-        elif args.action == "events":
-            # execute the events query
-            er.get_events(
-                keywords=keywords,
-                concepts=concepts,
-                categories=categories,
-                sources=sources,
-                languages=languages,
-                date_start=date_start,
-                date_end=date_end,
-                sort_by=sort_by,
-                sort_by_asc=sort_by_asc,
-                max_items=max_items,
-                save_to_file=save_to_file,
-                save_format=save_format,
-                verbose=verbose,
-            )
 
-        elif args.action == "event":
-            if not args.event_ids:
-                raise Exception("Attribute event_ids must be specified")
+def build_parser(action=None):
+    """Builds the command line argument parser
 
-            # get query specific information
-            event_ids = args.event_ids.split(",")
-            er.get_event(
-                event_ids=event_ids, save_to_file=save_to_file, save_format=save_format
-            )
+    Args:
+        action (str): The action whose arguments are added to the parser.
+            The other actions are registered without their arguments, since
+            only one action is executed. If None, the arguments of all
+            actions are added (Default: None).
 
-        elif args.action == "event_articles":
-            # get query specific information
-            event_id = args.event_id if args.event_id else None
-            # execute the events query
-            er.get_event_articles(
-                event_id,
-                keywords=keywords,
-                concepts=concepts,
-                categories=categories,
-                sources=sources,
-                languages=languages,
-                date_start=date_start,
-                date_end=date_end,
-                sort_by=sort_by,
-                sort_by_asc=sort_by_asc,
-                max_items=max_items,
-                save_to_file=save_to_file,
-                save_format=save_format,
-                verbose=verbose,
-            )
+    Returns:
+        ArgumentParser: The command line argument parser.
+    """
+    # since python 3.14 the help and error messages are colored by default,
+    # which loads and evaluates the terminal color theme when formatting them
+    options = {"color": False} if sys.version_info >= (3, 14) else {}
 
-        elif args.action == "event_articles_from_file":
-            # get query specific information
-            event_ids_file = args.event_ids_file if args.event_ids_file else None
-            event_file_type = args.event_file_type if args.event_file_type else None
-
-            # execute the events query
-            er.get_event_articles_from_file(
-                event_ids_file,
-                event_file_type=event_file_type,
-                keywords=keywords,
-                concepts=concepts,
-                categories=categories,
-                sources=sources,
-                languages=languages,
-                date_start=date_start,
-                date_end=date_end,
-                sort_by=sort_by,
-                sort_by_asc=sort_by_asc,
-                max_items=max_items,
-                save_to_folder=save_to_file,
-                save_format=save_format,
-                verbose=verbose,
-            )
+    argparser = argparse.ArgumentParser(
+        description=DESCRIPTION,
+        allow_abbrev=False,
+        add_help=False,
+        **options,
+    )
+    argparser.add_argument("-h", "--help", action=UsageAction)
+    argparser.add_argument("-V", "--version", action="version", version=__version__)
+    argparser.add_argument(
+        "--api_key",
+        type=str,
+        default=os.environ.get("EVENT_REGISTRY_API_KEY"),
+        help=API_KEY_HELP,
+    )
 
-        else:
-            raise Exception("Argument command is unknown: {}".format(args.command))
+    subparsers = argparser.add_subparsers(dest="action", required=True, help="command")
+    for name, (message, add_arguments) in ACTIONS.items():
+        subparser = subparsers.add_parser(
+            name, help=message, allow_abbrev=False, **options
+        )
+        if action is None or action == name:
+            add_arguments(subparser)
+
+    return argparser
+
+
+# the general usage, printed without building the argument parser, where
+# %(prog)s is replaced with the name of the program and %(indent)s with
+# the spaces aligning the wrapped usage lines after the program name
+USAGE = "\n".join(
+    (
+        "usage: %(prog)s [-h] [-V] [--api_key API_KEY]",
+        "%(indent)s{" + ",".join(ACTIONS) + "}",
+        "%(indent)s...",
+        "",
+        DESCRIPTION,
+        "",
+        "actions:",
+        *(f"    {name:<26}{message}" for name, (message, _) in ACTIONS.items()),
+        "",
+        "options:",
+        "    -h, --help                show this help message and exit",
+        "    -V, --version             show the version and exit",
+        f"    {'--api_key API_KEY':<26}{API_KEY_HELP}",
+        "",
+        "Use '%(prog)s {action} --help' to list the parameters of the action.",
+    )
+)
+
+
+def get_query_kwargs(args):
+    """Gets the query arguments shared by the collecting actions
+
+    Args:
+        args (Namespace): The parsed command line arguments.
+
+    Returns:
+        dict: The keyword arguments of the collector query methods.
+    """
+    return {
+        "keywords": parse_comma_separated(args.keywords),
+        "concepts": parse_comma_separated(args.concepts),
+        "categories": parse_comma_separated(args.categories),
+        "sources": parse_comma_separated(args.sources),
+        "languages": parse_comma_separated(args.languages),
+        "date_start": args.date_start,
+        "date_end": args.date_end,
+        "sort_by": args.sort_by,
+        "sort_by_asc": args.sort_by_asc,
+        "max_items": args.max_items,
+        "save_to_file": args.save_to_file,
+        "save_format": args.save_format,
+        "verbose": args.verbose,
+    }
+
+
+def run_event(er, args):
+    """Collects the events with the given ids"""
+    if not args.event_ids:
+        raise Exception("Attribute event_ids must be specified")
+    er.get_event(
+        event_ids=parse_comma_separated(args.event_ids),
+        save_to_file=args.save_to_file,
+        save_format=args.save_format,
+    )
+
+
+def run_event_articles_from_file(er, args):
+    """Collects the articles of the events listed in the file"""
+    kwargs = get_query_kwargs(args)
+    kwargs["save_to_folder"] = kwargs.pop("save_to_file")
+    event_articles = er.get_event_articles_from_file(
+        args.event_ids_file,
+        event_file_type=args.event_file_type,
+        batch_size=args.batch_size,
+        concurrency=args.concurrency,
+        **kwargs,
+    )
+    # go through the events to collect their articles
+    for _ in event_articles:
+        pass
+
+
+# the functions executing the actions: action -> function(collector, args)
+DISPATCH = {
+    "articles": lambda er, args: er.get_articles(**get_query_kwargs(args)),
+    "events": lambda er, args: er.get_events(**get_query_kwargs(args)),
+    "event": run_event,
+    "event_articles": lambda er, args: er.get_event_articles(
+        args.event_id, **get_query_kwargs(args)
+    ),
+    "event_articles_from_file": run_event_articles_from_file,
+}
+
+
+def handle_interrupt(signum, frame):
+    """Stops the collection when it is interrupted
+
+    The requests are executed in worker threads which cannot be
+    interrupted, hence they stop once their current request finishes
+    and the already retrieved items are stored. When interrupted
+    again, the process exits immediately.
+    """
+    if INTERRUPTED.is_set():
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(128 + signum)
+    INTERRUPTED.set()
+    print("Stopping the collection, press ctrl+c again to exit immediately")
+
+
+def main() -> None:
+    # stop the collection on ctrl+c once the retrieved items are stored
+    signal.signal(signal.SIGINT, handle_interrupt)
+
+    # answer the help and version requests without building the parser
+    argv = sys.argv[1:]
+    if argv in ([], ["-h"], ["--help"]):
+        print(format_usage(os.path.basename(sys.argv[0])))
+        sys.exit(0 if argv else 2)
+    if argv in (["-V"], ["--version"]):
+        print(__version__)
+        sys.exit(0)
+
+    # build only the arguments of the selected action
+    action = next(
+        (
+            a
+            for i, a in enumerate(argv)
+            if a in ACTIONS and argv[i - 1 : i] != ["--api_key"]
+        ),
+        None,
+    )
+    argparser = build_parser(action)
+
+    # parse the arguments and call whatever function was selected
+    args = argparser.parse_args()
+
+    if getattr(args, "max_items", -1) == 0:
+        # nothing to collect, skip creating the collector
+        print("The max_items is 0, no items are collected")
+        return
+
+    # fall back to the API key stored in the .env file
+    api_key = args.api_key or get_api_key()
+    if not api_key:
+        argparser.error("Provide --api_key or set EVENT_REGISTRY_API_KEY")
+
+    # initialize and execute query
+    er = get_collector(api_key, args.max_repeat_request)
+    try:
+        DISPATCH[args.action](er, args)
     except KeyboardInterrupt:
-        try:
-            sys.exit(0)
-        except SystemExit:
-            os._exit(0)
+        sys.exit(128 + signal.SIGINT)
 
 
 if __name__ == "__main__":